@@ -129,10 +129,10 @@ class LogEntry:
 
         message = " ".join(stubs) + f": {self.message}"
 
-        if "content" in self.extra.keys():
+        if "content" in self.extra:
             message += "\n" + self.extra["content"]
 
-        if "traceback" in self.extra.keys():
+        if "traceback" in self.extra:
             message += "\n" + "".join(self.extra["traceback"])
 
         return message.replace("```", "`\u200B``")
@@ -156,10 +156,10 @@ class LogEntry:
 
         message = " ".join(stubs) + f": {self.message}"
 
-        if "content" in self.extra.keys():
+        if "content" in self.extra:
             message += "\n" + self.extra["content"]
 
-        if "traceback" in self.extra.keys():
+        if "traceback" in self.extra:
             message += "\n" + "".join(self.extra["traceback"])
 
         return message
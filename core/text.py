@@ -100,13 +100,13 @@ class Translator:
         data = self.data[langcode]
 
         # get key
-        if command not in data.keys():
+        if command not in data:
             raise BadTranslation(langfile, command)
 
         _gender = Config.get().gender
-        if string + "." + _gender in data[command].keys():
+        if string + "." + _gender in data[command]:
             string += "." + _gender
-        elif string in data[command].keys():
+        elif string in data[command]:
             pass
         else:
             raise BadTranslation(langfile, command, string)
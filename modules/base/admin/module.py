@@ -537,7 +537,7 @@ class Admin(commands.Cog):
                 init[key.strip()] = value.strip("\n ").replace("'", "").replace('"', "")
 
         for key in ("__all__", "__name__", "__version__"):
-            if key not in init.keys():
+            if key not in init:
                 return Repository(
                     path, False, "missing value", {"value": utils.Text.sanitise(key)}
                 )
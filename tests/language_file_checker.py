@@ -67,7 +67,7 @@ class Module:
 
             for key, _ in a[section].items():
                 for gender in ("", ".m", "f"):
-                    if key + gender in b[section].keys():
+                    if key + gender in b[section]:
                         break
                 else:
                     return f'{err} Missing key "{section}"/"{key}".'
@@ -81,7 +81,7 @@ class Module:
                 if key.endswith(".m") or key.endswith(".f"):
                     key = key[:-2]
 
-                if key not in a[section].keys():
+                if key not in a[section]:
                     return f'{err} Extra key "{section}"/"{key}".'
 
 